@@ -36,14 +36,22 @@ class AuthManager:
         self.instance_url = instance_url
         self.token: Optional[str] = None
         self.token_type: Optional[str] = None
-    
+        self._cached_headers: Optional[Dict[str, str]] = None
+
     def get_headers(self) -> Dict[str, str]:
         """
         Get the authentication headers for API requests.
-        
+
+        The computed headers are cached, since for basic auth and API keys
+        they never change and for OAuth they only change on token refresh.
+        A copy is returned so callers can add their own headers safely.
+
         Returns:
             Dict[str, str]: Headers to include in API requests.
         """
+        if self._cached_headers is not None:
+            return dict(self._cached_headers)
+
         headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
@@ -68,9 +76,10 @@ class AuthManager:
                 raise ValueError("API key configuration is required")
             
             headers[self.config.api_key.header_name] = self.config.api_key.api_key
-        
-        return headers
-    
+
+        self._cached_headers = headers
+        return dict(headers)
+
     def _get_oauth_token(self):
         """
         Get an OAuth token from ServiceNow.
@@ -82,6 +91,9 @@ class AuthManager:
             raise ValueError("OAuth configuration is required")
         oauth_config = self.config.oauth
 
+        # The Authorization header is about to change
+        self._cached_headers = None
+
         # Determine token URL
         token_url = oauth_config.token_url
         if not token_url:
@@ -4,6 +4,7 @@ ServiceNow MCP Server
 This module provides the main implementation of the ServiceNow MCP server.
 """
 
+import inspect
 import json
 import logging
 import os
@@ -112,6 +113,10 @@ class ServiceNowMCP:
 
         self._register_handlers()
 
+        # The initialization options are static once the handlers are
+        # registered; build them once so every connection can reuse them
+        self._init_options = self.mcp_server.create_initialization_options()
+
     def _register_handlers(self):
         """Register the list_tools and call_tool handlers."""
         self.mcp_server.list_tools()(self._list_tools_impl)
@@ -275,6 +280,10 @@ class ServiceNowMCP:
         # Execute the tool implementation function
         try:
             result = impl_func(self.config, self.auth_manager, params)
+            # Async tool implementations return a coroutine; await it here so
+            # their network I/O overlaps with other requests on the event loop.
+            if inspect.isawaitable(result):
+                result = await result
             logger.debug(f"Raw result type from tool '{name}': {type(result)}")
         except Exception as e:
             logger.error(f"Error executing tool '{name}': {e}", exc_info=True)
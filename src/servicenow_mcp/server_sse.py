@@ -5,9 +5,14 @@ This module provides the main implementation of the ServiceNow MCP server.
 """
 
 import argparse
+import contextlib
+import hashlib
 import os
-from typing import Dict, Union
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
 
+import httpx
 import uvicorn
 from dotenv import load_dotenv
 from mcp.server import Server
@@ -15,17 +20,77 @@ from mcp.server.fastmcp import FastMCP
 from mcp.server.sse import SseServerTransport
 from starlette.applications import Starlette
 from starlette.requests import Request
+from starlette.responses import JSONResponse
 from starlette.routing import Mount, Route
 
+from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.server import ServiceNowMCP
+from servicenow_mcp.tools import catalog_task_tools
 from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, ServerConfig
 
+# Preflight results are cached briefly so each SSE connection does not pay
+# an extra round trip to ServiceNow.
+_PREFLIGHT_TTL = 60.0
+_preflight_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
 
-def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlette:
+
+async def _preflight_auth(config: ServerConfig, auth_manager: AuthManager) -> bool:
+    """
+    Cheaply verify the configured credentials against ServiceNow.
+
+    Returns False only when ServiceNow rejects the credentials outright;
+    probe failures (timeouts, network errors) do not block the connection.
+    """
+    headers = auth_manager.get_headers()
+    token_hash = hashlib.blake2b(
+        headers.get("Authorization", "").encode(), digest_size=16
+    ).hexdigest()
+    key = (config.instance_url, token_hash)
+
+    now = time.monotonic()
+    cached = _preflight_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{config.instance_url}/api/now/table/sys_user",
+                params={"sysparm_limit": 1, "sysparm_fields": "sys_id"},
+                headers=headers,
+                timeout=5.0,
+            )
+    except httpx.HTTPError:
+        return True
+
+    ok = response.status_code not in (401, 403)
+    _preflight_cache[key] = (now + _PREFLIGHT_TTL, ok)
+    return ok
+
+
+def create_starlette_app(
+    mcp_server: Server,
+    *,
+    debug: bool = False,
+    config: Optional[ServerConfig] = None,
+    auth_manager: Optional[AuthManager] = None,
+    init_options=None,
+) -> Starlette:
     """Create a Starlette application that can serve the provided mcp server with SSE."""
     sse = SseServerTransport("/messages/")
 
-    async def handle_sse(request: Request) -> None:
+    # Initialization options are static per server instance; building them
+    # per connection just repeats the same capability introspection
+    if init_options is None:
+        init_options = mcp_server.create_initialization_options()
+
+    async def handle_sse(request: Request):
+        # Reject bad credentials before spinning up an MCP session for a
+        # connection that can never make a successful ServiceNow call
+        if config is not None and auth_manager is not None:
+            if not await _preflight_auth(config, auth_manager):
+                return JSONResponse({"error": "Invalid credentials"}, status_code=401)
+
         async with sse.connect_sse(
             request.scope,
             request.receive,
@@ -34,15 +99,22 @@ def create_starlette_app(mcp_server: Server, *, debug: bool = False) -> Starlett
             await mcp_server.run(
                 read_stream,
                 write_stream,
-                mcp_server.create_initialization_options(),
+                init_options,
             )
 
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette):
+        yield
+        # Close the shared HTTP client used by the async tool modules
+        await catalog_task_tools.aclose_client()
+
     return Starlette(
         debug=debug,
         routes=[
             Route("/sse", endpoint=handle_sse),
             Mount("/messages/", app=sse.handle_post_message),
         ],
+        lifespan=lifespan,
     )
 
 
@@ -72,10 +144,42 @@ class ServiceNowSSEMCP(ServiceNowMCP):
             port: Port to listen on
         """
         # Create Starlette app with SSE transport
-        starlette_app = create_starlette_app(self.mcp_server, debug=True)
+        starlette_app = create_starlette_app(
+            self.mcp_server,
+            debug=True,
+            config=self.config,
+            auth_manager=self.auth_manager,
+            # Fall back to building the options in create_starlette_app if an
+            # older instance predates the cached attribute
+            init_options=getattr(self, "_init_options", None),
+        )
+
+        # Prefer the uvloop event loop and httptools parser when available;
+        # fall back to the stdlib stack (e.g. on Windows)
+        try:
+            import uvloop  # noqa: F401
+
+            loop = "uvloop"
+        except ImportError:
+            loop = "asyncio"
+        try:
+            import httptools  # noqa: F401
+
+            http = "httptools"
+        except ImportError:
+            http = "h11"
 
         # Run using uvicorn
-        uvicorn.run(starlette_app, host=host, port=port)
+        uvicorn.run(starlette_app, host=host, port=port, loop=loop, http=http, lifespan="on")
+
+
+# Cache of configured server instances keyed by credential tuple, so repeated
+# factory calls (e.g. across SSE reconnects) reuse the same tool registry
+# instead of rebuilding every Pydantic schema. Passwords are hashed so the
+# cache key does not retain cleartext.
+_INSTANCE_CACHE: Dict[Tuple[str, str, str], "ServiceNowSSEMCP"] = {}
+_INSTANCE_CACHE_LOCK = threading.Lock()
+_INSTANCE_CACHE_MAXSIZE = 128
 
 
 def create_servicenow_mcp(instance_url: str, username: str, password: str):
@@ -83,7 +187,9 @@ def create_servicenow_mcp(instance_url: str, username: str, password: str):
     Create a ServiceNow MCP server with minimal configuration.
 
     This is a simplified factory function that creates a pre-configured
-    ServiceNow MCP server with basic authentication.
+    ServiceNow MCP server with basic authentication. Instances are cached
+    per (instance_url, username, password) so repeated calls with the same
+    credentials return the same server.
 
     Args:
         instance_url: ServiceNow instance URL
@@ -109,16 +215,29 @@ def create_servicenow_mcp(instance_url: str, username: str, password: str):
         ```
     """
 
-    # Create basic auth config
-    auth_config = AuthConfig(
-        type=AuthType.BASIC, basic=BasicAuthConfig(username=username, password=password)
-    )
+    password_hash = hashlib.blake2b(password.encode(), digest_size=16).hexdigest()
+    cache_key = (instance_url, username, password_hash)
+
+    with _INSTANCE_CACHE_LOCK:
+        server = _INSTANCE_CACHE.get(cache_key)
+        if server is not None:
+            return server
+
+        # Create basic auth config
+        auth_config = AuthConfig(
+            type=AuthType.BASIC, basic=BasicAuthConfig(username=username, password=password)
+        )
 
-    # Create server config
-    config = ServerConfig(instance_url=instance_url, auth=auth_config)
+        # Create server config
+        config = ServerConfig(instance_url=instance_url, auth=auth_config)
 
-    # Create and return server
-    return ServiceNowSSEMCP(config)
+        # Create, cache and return server
+        server = ServiceNowSSEMCP(config)
+        if len(_INSTANCE_CACHE) >= _INSTANCE_CACHE_MAXSIZE:
+            # Evict the oldest entry (insertion order) to stay bounded
+            _INSTANCE_CACHE.pop(next(iter(_INSTANCE_CACHE)))
+        _INSTANCE_CACHE[cache_key] = server
+        return server
 
 
 def main():
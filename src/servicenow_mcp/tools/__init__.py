@@ -7,6 +7,12 @@ from servicenow_mcp.tools.catalog_optimization import (
     get_optimization_recommendations,
     update_catalog_item,
 )
+from servicenow_mcp.tools.catalog_task_tools import (
+    get_catalog_task,
+    get_catalog_tasks_bulk,
+    list_catalog_tasks,
+    update_catalog_task,
+)
 from servicenow_mcp.tools.catalog_tools import (
     create_catalog_category,
     get_catalog_item,
@@ -137,7 +143,13 @@ __all__ = [
     "create_catalog_item_variable",
     "list_catalog_item_variables",
     "update_catalog_item_variable",
-    
+
+    # Catalog task tools
+    "list_catalog_tasks",
+    "get_catalog_task",
+    "get_catalog_tasks_bulk",
+    "update_catalog_task",
+
     # Change management tools
     "create_change_request",
     "update_change_request",
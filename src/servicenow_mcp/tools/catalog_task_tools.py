@@ -0,0 +1,650 @@
+"""
+Catalog Task tools for the ServiceNow MCP server.
+
+This module provides tools for managing catalog tasks (sc_task) in ServiceNow.
+
+The tools are async and share a single httpx.AsyncClient so concurrent MCP
+tool calls overlap their ServiceNow round trips instead of serializing
+behind the event loop, while reusing pooled keep-alive connections.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from typing import Any, Dict, List, NotRequired, Optional, TypedDict
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ijson = None
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.config import ServerConfig
+
+logger = logging.getLogger(__name__)
+
+_ACLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _ACLIENT
+    if _ACLIENT is None:
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=64)
+        # The transport does not eagerly check for the h2 extra; without this
+        # probe it would offer HTTP/2 via ALPN and then fail at request time
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=3)
+        _ACLIENT = httpx.AsyncClient(transport=transport)
+    return _ACLIENT
+
+
+async def aclose_client() -> None:
+    """Close the shared AsyncClient (called from the server lifespan)."""
+    global _ACLIENT
+    if _ACLIENT is not None:
+        await _ACLIENT.aclose()
+        _ACLIENT = None
+
+
+class ListCatalogTasksParams(BaseModel):
+    """Parameters for listing catalog tasks."""
+
+    # Build the pydantic-core validator on first use instead of at import,
+    # keeping module import cheap (this cost repeats across every *_tools module)
+    model_config = ConfigDict(defer_build=True)
+
+    limit: int = Field(10, description="Maximum number of catalog tasks to return")
+    offset: int = Field(0, description="Offset for pagination")
+    state: Optional[str] = Field(None, description="Filter by state")
+    assigned_to: Optional[str] = Field(None, description="Filter by assigned user")
+    assignment_group: Optional[str] = Field(None, description="Filter by assignment group")
+    request_id: Optional[str] = Field(None, description="Filter by parent request sys_id")
+    query: Optional[str] = Field(None, description="Search query for catalog tasks")
+
+
+class GetCatalogTaskParams(BaseModel):
+    """Parameters for getting a catalog task."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    task_id: str = Field(..., description="Catalog task number or sys_id")
+
+
+class BulkGetCatalogTasksParams(BaseModel):
+    """Parameters for getting multiple catalog tasks at once."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    task_ids: List[str] = Field(..., description="Catalog task numbers or sys_ids")
+    chunk_size: int = Field(50, description="Maximum number of tasks to fetch per request")
+
+
+class CatalogTaskResponse(TypedDict):
+    """
+    Result shape shared by the catalog task tools.
+
+    This is a plain dict at runtime: only the input params models above pay
+    for pydantic-core validator construction, tool outputs do not.
+    """
+
+    success: bool
+    message: str
+    tasks: NotRequired[List[Dict[str, Any]]]
+    task: NotRequired[Dict[str, Any]]
+    not_found: NotRequired[List[str]]
+
+
+class UpdateCatalogTaskParams(BaseModel):
+    """Parameters for updating a catalog task."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    task_id: str = Field(..., description="Catalog task number or sys_id")
+    short_description: Optional[str] = Field(None, description="Short description of the catalog task")
+    description: Optional[str] = Field(None, description="Detailed description of the catalog task")
+    state: Optional[str] = Field(None, description="State of the catalog task")
+    priority: Optional[str] = Field(None, description="Priority of the catalog task")
+    assigned_to: Optional[str] = Field(None, description="User assigned to the catalog task")
+    assignment_group: Optional[str] = Field(None, description="Group assigned to the catalog task")
+    work_notes: Optional[str] = Field(None, description="Work notes to add to the catalog task")
+    due_date: Optional[str] = Field(None, description="Due date for the catalog task")
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a ServiceNow JSON response, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+class _ResponseReader:
+    """Minimal async file-like over a streaming httpx response, for ijson."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the reader with read(0) to detect the data type;
+        # don't consume a chunk for that
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+# Matches a 32-character hex sys_id, compiled once for the whole module
+_SYS_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+def _is_sys_id(task_id: str) -> bool:
+    """Check whether a task identifier looks like a sys_id rather than a task number."""
+    return _SYS_ID_RE.match(task_id) is not None
+
+
+# Short-TTL cache of get_catalog_task responses, keyed by
+# (instance_url, credential hash, task identifier). Agents tend to re-read
+# the same task several times in quick succession; a hit skips the HTTP
+# round trip entirely. Entries expire after ServerConfig.task_cache_ttl
+# seconds and updates invalidate the affected task. The credential hash
+# keeps reads cached for one user from being served to another user of the
+# same instance, who may be subject to different ServiceNow ACLs.
+_CACHE_MAXSIZE = 512
+_task_cache: Dict[tuple, tuple] = {}
+_task_cache_lock = asyncio.Lock()
+
+
+def _auth_hash(auth_manager: AuthManager) -> str:
+    """Hash of the auth headers, used to scope cached reads per credential."""
+    headers = auth_manager.get_headers()
+    raw = "\n".join(f"{key}:{value}" for key, value in sorted(headers.items()))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+async def _task_cache_get(cache_key: tuple) -> Optional[Dict[str, Any]]:
+    """Return a cached response if present and not expired."""
+    async with _task_cache_lock:
+        cached = _task_cache.get(cache_key)
+        if cached is None:
+            return None
+        expires_at, response = cached
+        if expires_at <= time.monotonic():
+            del _task_cache[cache_key]
+            return None
+        return response
+
+
+async def _task_cache_put(
+    instance_url: str, auth_hash: str, response: Dict[str, Any], ttl: int
+) -> None:
+    """Cache a successful get response under both its sys_id and number."""
+    task = response.get("task") or {}
+    expires_at = time.monotonic() + ttl
+    async with _task_cache_lock:
+        for task_id in (task.get("sys_id"), task.get("number")):
+            if task_id:
+                if len(_task_cache) >= _CACHE_MAXSIZE:
+                    # Evict the oldest entry (insertion order) to stay bounded
+                    _task_cache.pop(next(iter(_task_cache)))
+                _task_cache[(instance_url, auth_hash, task_id)] = (expires_at, response)
+
+
+async def _task_cache_invalidate(
+    instance_url: str, auth_hash: str, *task_ids: Optional[str]
+) -> None:
+    """Drop any cached entries for the given task identifiers."""
+    async with _task_cache_lock:
+        for task_id in task_ids:
+            if task_id:
+                _task_cache.pop((instance_url, auth_hash, task_id), None)
+
+
+def _ref_value(field: Any) -> tuple:
+    """
+    Return (display_value, value) for a field from a sysparm_display_value=all
+    response, where every field comes back as a dict. Plain values are returned
+    unchanged in both positions.
+    """
+    if isinstance(field, dict):
+        return field.get("display_value"), field.get("value")
+    return field, field
+
+
+# Output shape of the formatted task rows, shared by list/get/bulk: each entry
+# is (output key, source field, index into the (display_value, value) pair).
+_LIST_FIELD_MAP = (
+    ("sys_id", "sys_id", 1),
+    ("number", "number", 1),
+    ("short_description", "short_description", 0),
+    ("state", "state", 0),
+    ("priority", "priority", 0),
+    ("assigned_to", "assigned_to", 0),
+    ("assignment_group", "assignment_group", 0),
+    ("due_date", "due_date", 0),
+    ("opened_at", "opened_at", 0),
+)
+_GET_FIELD_MAP = _LIST_FIELD_MAP + (
+    ("description", "description", 0),
+    ("work_notes", "work_notes", 0),
+    ("closed_at", "closed_at", 0),
+)
+
+
+# Column lists passed as sysparm_fields so ServiceNow only returns what the
+# row builders consume, instead of every sc_task column
+_LIST_FIELDS = ",".join([field for _, field, _ in _LIST_FIELD_MAP] + ["request"])
+_GET_FIELDS = ",".join([field for _, field, _ in _GET_FIELD_MAP] + ["request"])
+
+
+def _make_row_builder(field_map: tuple):
+    """
+    Generate a row-builder function specialized to one field map.
+
+    The output schema is fixed at import time, so instead of looping over the
+    field map per row the generated function is a single flat dict literal,
+    saving the per-row iteration and tuple indexing on hot list paths.
+    """
+    lines = ["def _build_row(task_data, _ref_value=_ref_value):", "    return {"]
+    for key, field, index in field_map:
+        lines.append(f"        {key!r}: _ref_value(task_data.get({field!r}))[{index}],")
+    lines.append('        "request": (_request := _ref_value(task_data.get("request")))[0],')
+    lines.append('        "request_id": _request[1],')
+    lines.append("    }")
+    namespace = {"_ref_value": _ref_value}
+    exec("\n".join(lines), namespace)  # noqa: S102 - source built from literals above
+    return namespace["_build_row"]
+
+
+_build_list_row = _make_row_builder(_LIST_FIELD_MAP)
+_build_get_row = _make_row_builder(_GET_FIELD_MAP)
+
+
+async def list_catalog_tasks(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: ListCatalogTasksParams,
+) -> CatalogTaskResponse:
+    """
+    List catalog tasks from ServiceNow.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for listing catalog tasks.
+
+    Returns:
+        Dictionary with list of catalog tasks.
+    """
+    api_url = f"{config.api_url}/table/sc_task"
+
+    # Build query parameters
+    query_params = {
+        "sysparm_limit": params.limit,
+        "sysparm_offset": params.offset,
+        "sysparm_fields": _LIST_FIELDS,
+        "sysparm_display_value": "all",
+        "sysparm_exclude_reference_link": "true",
+    }
+
+    # Add filters, skipping fields that were not provided
+    pairs = (
+        ("state", params.state),
+        ("assigned_to", params.assigned_to),
+        ("assignment_group", params.assignment_group),
+        ("request", params.request_id),
+    )
+    filters = [f"{field}={value}" for field, value in pairs if value]
+    if params.query:
+        query = params.query
+        filters.append(f"short_descriptionLIKE{query}^ORdescriptionLIKE{query}")
+
+    if filters:
+        query_params["sysparm_query"] = "^".join(filters)
+
+    # Make request
+    try:
+        if ijson is not None and params.limit > config.stream_threshold:
+            # Large pages: parse rows incrementally as the response body
+            # arrives instead of buffering the whole payload and decoding
+            # it in one go, roughly halving peak memory during the parse
+            tasks = []
+            async with _get_client().stream(
+                "GET",
+                api_url,
+                params=query_params,
+                headers=auth_manager.get_headers(),
+                timeout=config.timeout,
+            ) as response:
+                response.raise_for_status()
+                async for task_data in ijson.items(_ResponseReader(response), "result.item"):
+                    tasks.append(_build_list_row(task_data))
+        else:
+            response = await _get_client().get(
+                api_url,
+                params=query_params,
+                headers=auth_manager.get_headers(),
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+
+            data = _decode_json(response)
+            tasks = [
+                _build_list_row(task_data)
+                for task_data in data.get("result", [])
+            ]
+
+        return {
+            "success": True,
+            "message": f"Found {len(tasks)} catalog tasks",
+            "tasks": tasks,
+        }
+
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to list catalog tasks: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to list catalog tasks: {str(e)}",
+            "tasks": [],
+        }
+
+
+async def get_catalog_task(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: GetCatalogTaskParams,
+) -> CatalogTaskResponse:
+    """
+    Get a specific catalog task from ServiceNow by number or sys_id.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for getting the catalog task.
+
+    Returns:
+        Dictionary with the catalog task details.
+    """
+    api_url = f"{config.api_url}/table/sc_task"
+    task_id = params.task_id
+
+    ttl = config.task_cache_ttl
+    if ttl > 0:
+        auth_hash = _auth_hash(auth_manager)
+        cached = await _task_cache_get((config.instance_url, auth_hash, task_id))
+        if cached is not None:
+            return cached
+
+    try:
+        # A sys_id can be fetched directly; a task number is resolved with a
+        # single query that already returns the full record, so either way
+        # only one round trip is needed.
+        if _is_sys_id(task_id):
+            url = f"{api_url}/{task_id}"
+            query_params = {
+                "sysparm_fields": _GET_FIELDS,
+                "sysparm_display_value": "all",
+                "sysparm_exclude_reference_link": "true",
+            }
+        else:
+            url = api_url
+            query_params = {
+                "sysparm_query": f"number={task_id}",
+                "sysparm_limit": 1,
+                "sysparm_fields": _GET_FIELDS,
+                "sysparm_display_value": "all",
+                "sysparm_exclude_reference_link": "true",
+            }
+
+        response = await _get_client().get(
+            url,
+            params=query_params,
+            headers=auth_manager.get_headers(),
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+
+        data = _decode_json(response).get("result")
+        if isinstance(data, list):
+            task_data = data[0] if data else None
+        else:
+            task_data = data
+        if not task_data:
+            return {
+                "success": False,
+                "message": f"Catalog task not found: {task_id}",
+            }
+
+        task = _build_get_row(task_data)
+
+        result = {
+            "success": True,
+            "message": f"Catalog task {task['number']} found",
+            "task": task,
+        }
+        if ttl > 0:
+            await _task_cache_put(config.instance_url, auth_hash, result, ttl)
+        return result
+
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to get catalog task: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to get catalog task: {str(e)}",
+        }
+
+
+async def get_catalog_tasks_bulk(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: BulkGetCatalogTasksParams,
+) -> CatalogTaskResponse:
+    """
+    Get multiple catalog tasks from ServiceNow in batched queries.
+
+    Instead of one round trip per task, the requested IDs are grouped into
+    chunks and each chunk is fetched with a single IN query; chunks are
+    fetched concurrently with a bounded amount of parallelism.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for the bulk lookup.
+
+    Returns:
+        Dictionary with the catalog tasks that were found and any requested
+        IDs that were not.
+    """
+    api_url = f"{config.api_url}/table/sc_task"
+
+    # Deduplicate while preserving the requested order
+    task_ids = list(dict.fromkeys(params.task_ids))
+    if not task_ids:
+        return {
+            "success": True,
+            "message": "No task IDs provided",
+            "tasks": [],
+            "not_found": [],
+        }
+
+    chunk_size = max(params.chunk_size, 1)
+    chunks = [task_ids[i : i + chunk_size] for i in range(0, len(task_ids), chunk_size)]
+
+    headers = auth_manager.get_headers()
+    semaphore = asyncio.Semaphore(10)
+
+    async def _fetch_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+        sys_ids = [task_id for task_id in chunk if _is_sys_id(task_id)]
+        numbers = [task_id for task_id in chunk if not _is_sys_id(task_id)]
+
+        query_parts = []
+        if sys_ids:
+            query_parts.append("sys_idIN" + ",".join(sys_ids))
+        if numbers:
+            query_parts.append("numberIN" + ",".join(numbers))
+
+        query_params = {
+            "sysparm_query": "^OR".join(query_parts),
+            "sysparm_limit": len(chunk),
+            "sysparm_fields": _LIST_FIELDS,
+            "sysparm_display_value": "all",
+            "sysparm_exclude_reference_link": "true",
+        }
+
+        async with semaphore:
+            response = await _get_client().get(
+                api_url,
+                params=query_params,
+                headers=headers,
+                timeout=config.timeout,
+            )
+        response.raise_for_status()
+        return _decode_json(response).get("result", [])
+
+    try:
+        chunk_results = await asyncio.gather(*(_fetch_chunk(chunk) for chunk in chunks))
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to get catalog tasks in bulk: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to get catalog tasks in bulk: {str(e)}",
+            "tasks": [],
+            "not_found": [],
+        }
+
+    tasks = []
+    found_ids = set()
+    for task_data in (row for rows in chunk_results for row in rows):
+        task = _build_list_row(task_data)
+        tasks.append(task)
+        found_ids.add(task["sys_id"])
+        found_ids.add(task["number"])
+
+    not_found = [task_id for task_id in task_ids if task_id not in found_ids]
+
+    return {
+        "success": True,
+        "message": f"Found {len(tasks)} of {len(task_ids)} catalog tasks",
+        "tasks": tasks,
+        "not_found": not_found,
+    }
+
+
+async def update_catalog_task(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: UpdateCatalogTaskParams,
+) -> CatalogTaskResponse:
+    """
+    Update an existing catalog task in ServiceNow.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for updating the catalog task.
+
+    Returns:
+        Dictionary with the updated catalog task.
+    """
+    api_url = f"{config.api_url}/table/sc_task"
+    task_id = params.task_id
+
+    # Build the update payload from the provided fields
+    data = {}
+    if params.short_description is not None:
+        data["short_description"] = params.short_description
+    if params.description is not None:
+        data["description"] = params.description
+    if params.state is not None:
+        data["state"] = params.state
+    if params.priority is not None:
+        data["priority"] = params.priority
+    if params.assigned_to is not None:
+        data["assigned_to"] = params.assigned_to
+    if params.assignment_group is not None:
+        data["assignment_group"] = params.assignment_group
+    if params.work_notes is not None:
+        data["work_notes"] = params.work_notes
+    if params.due_date is not None:
+        data["due_date"] = params.due_date
+
+    # Nothing to send; skip the round trip entirely
+    if not data:
+        return {
+            "success": False,
+            "message": "No fields provided to update",
+        }
+
+    headers = auth_manager.get_headers()
+
+    try:
+        if _is_sys_id(task_id):
+            sys_id = task_id
+        else:
+            # Resolve the task number to a sys_id first; only that one
+            # column is needed, so don't fetch the rest of the row
+            query_params = {
+                "sysparm_query": f"number={task_id}",
+                "sysparm_limit": 1,
+                "sysparm_fields": "sys_id",
+                "sysparm_exclude_reference_link": "true",
+            }
+            response = await _get_client().get(
+                api_url,
+                params=query_params,
+                headers=headers,
+                timeout=config.timeout,
+            )
+            response.raise_for_status()
+
+            result = _decode_json(response).get("result", [])
+            if not result:
+                return {
+                    "success": False,
+                    "message": f"Catalog task not found: {task_id}",
+                }
+            sys_id = result[0].get("sys_id")
+
+        response = await _get_client().patch(
+            f"{api_url}/{sys_id}",
+            json=data,
+            headers=headers,
+            timeout=config.timeout,
+        )
+        response.raise_for_status()
+
+        result = _decode_json(response).get("result", {})
+
+        # Drop any cached reads of this task, under both identifier forms
+        await _task_cache_invalidate(
+            config.instance_url, _auth_hash(auth_manager), task_id, sys_id, result.get("number")
+        )
+
+        return {
+            "success": True,
+            "message": f"Catalog task {task_id} updated",
+            "task": result,
+        }
+
+    except httpx.HTTPError as e:
+        logger.error(f"Failed to update catalog task: {e}")
+        return {
+            "success": False,
+            "message": f"Failed to update catalog task: {str(e)}",
+        }
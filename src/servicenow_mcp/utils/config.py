@@ -56,6 +56,8 @@ class ServerConfig(BaseModel):
     auth: AuthConfig
     debug: bool = False
     timeout: int = 30
+    task_cache_ttl: int = 15
+    stream_threshold: int = 1000
 
     @property
     def api_url(self) -> str:
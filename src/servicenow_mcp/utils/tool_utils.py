@@ -12,6 +12,24 @@ from servicenow_mcp.tools.catalog_optimization import (
 from servicenow_mcp.tools.catalog_optimization import (
     update_catalog_item as update_catalog_item_tool,
 )
+from servicenow_mcp.tools.catalog_task_tools import (
+    BulkGetCatalogTasksParams,
+    GetCatalogTaskParams,
+    ListCatalogTasksParams,
+    UpdateCatalogTaskParams,
+)
+from servicenow_mcp.tools.catalog_task_tools import (
+    get_catalog_task as get_catalog_task_tool,
+)
+from servicenow_mcp.tools.catalog_task_tools import (
+    get_catalog_tasks_bulk as get_catalog_tasks_bulk_tool,
+)
+from servicenow_mcp.tools.catalog_task_tools import (
+    list_catalog_tasks as list_catalog_tasks_tool,
+)
+from servicenow_mcp.tools.catalog_task_tools import (
+    update_catalog_task as update_catalog_task_tool,
+)
 from servicenow_mcp.tools.catalog_tools import (
     CreateCatalogCategoryParams,
     GetCatalogItemParams,
@@ -486,6 +504,35 @@ def get_tool_definitions(
             "Update a catalog item variable",
             "dict",  # Tool returns Pydantic model
         ),
+        # Catalog Task Tools
+        "list_catalog_tasks": (
+            list_catalog_tasks_tool,
+            ListCatalogTasksParams,
+            str,  # Expects JSON string
+            "List catalog tasks from ServiceNow",
+            "json",  # Tool returns list/dict
+        ),
+        "get_catalog_task": (
+            get_catalog_task_tool,
+            GetCatalogTaskParams,
+            str,  # Expects JSON string
+            "Get a specific catalog task from ServiceNow",
+            "json",  # Tool returns list/dict
+        ),
+        "get_catalog_tasks_bulk": (
+            get_catalog_tasks_bulk_tool,
+            BulkGetCatalogTasksParams,
+            str,  # Expects JSON string
+            "Get multiple catalog tasks from ServiceNow in one batched query",
+            "json",  # Tool returns list/dict
+        ),
+        "update_catalog_task": (
+            update_catalog_task_tool,
+            UpdateCatalogTaskParams,
+            str,  # Expects JSON string
+            "Update an existing catalog task in ServiceNow",
+            "json",  # Tool returns list/dict
+        ),
         # Change Management Tools
         "create_change_request": (
             create_change_request_tool,